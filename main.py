@@ -4,6 +4,7 @@ from processors.account_processor import process_accounts
 from processors.summary_processor import generate_summary_data
 from output.excel_generator import generate_excel_report
 from utils.text_splitter import split_by_section_headers
+from storage.report_store import ReportStore, DEFAULT_STORE_PATH, hash_file, hash_text
 import warnings
 import os
 from datetime import datetime
@@ -12,17 +13,10 @@ import json
 
 warnings.filterwarnings("ignore", message="Could get FontBBox from font descriptor*")
 
-def process_credit_report(pdf_file_path):
+def merge_chunk_sections(chunk_results):
     """
-    Main processing logic for a single credit report PDF.
-    Takes a file path, processes it, and returns a JSON object with the full analysis.
+    Combine the per-chunk segmentation results into a single sections dictionary.
     """
-    extractor = PDFTextExtractor(pdf_file_path)
-    text = extractor.extract_text()
-    
-    print("\n--- Splitting Document and Processing Chunks ---")
-    chunks = split_by_section_headers(text)
-    
     final_sections = {
         "report_summary": {},
         "surviving_inquiries": [],
@@ -30,9 +24,7 @@ def process_credit_report(pdf_file_path):
         "credit_repair": []
     }
 
-    for i, chunk in enumerate(chunks):
-        print(f"Processing chunk {i+1}/{len(chunks)}...")
-        chunk_sections = segment_credit_report(chunk)
+    for chunk_sections in chunk_results:
         if chunk_sections and isinstance(chunk_sections, dict):
             final_sections["surviving_inquiries"].extend(chunk_sections.get("surviving_inquiries", []))
             final_sections["accounts"].extend(chunk_sections.get("accounts", []))
@@ -42,7 +34,59 @@ def process_credit_report(pdf_file_path):
             if isinstance(summary_chunk, dict):
                 final_sections["report_summary"].update(summary_chunk)
 
-    # --- Post-Processing and Data Structuring ---
+    return final_sections
+
+def extract_chunk_sections(pdf_file_path, store=None, source_name=None):
+    """
+    Extracts the PDF text and segments each chunk with the LLM.
+    When a ReportStore is given, previously extracted text and segmented chunks are
+    reused and any new results are persisted for later re-analysis.
+    """
+    report_hash = None
+    text = None
+    if store is not None:
+        report_hash = hash_file(pdf_file_path)
+        # Incomplete stored text (empty, or with scanned pages not OCR'd) is not returned, so it is retried
+        text = store.get_text(report_hash)
+        if text:
+            print("Using stored text for this report.")
+
+    if not text:
+        extractor = PDFTextExtractor(pdf_file_path)
+        text = extractor.extract_text()
+        if store is not None:
+            store.save_text(
+                report_hash,
+                text,
+                complete=bool(text) and not extractor.ocr_incomplete,
+                source_name=source_name or os.path.basename(str(pdf_file_path))
+            )
+    
+    print("\n--- Splitting Document and Processing Chunks ---")
+    chunks = split_by_section_headers(text)
+
+    chunk_results = []
+    for i, chunk in enumerate(chunks):
+        chunk_sections = store.get_chunk_sections(hash_text(chunk)) if store is not None else None
+        if chunk_sections is not None:
+            print(f"Using stored result for chunk {i+1}/{len(chunks)}.")
+        else:
+            print(f"Processing chunk {i+1}/{len(chunks)}...")
+            chunk_sections = segment_credit_report(chunk)
+        if store is not None:
+            store.save_chunk(report_hash, i, chunk, chunk_sections)
+        chunk_results.append(chunk_sections)
+
+    if store is not None:
+        store.prune_chunks(report_hash, len(chunks))
+
+    return chunk_results
+
+def analyze_sections(final_sections):
+    """
+    Runs the downstream stages (account processing, payoff, risk bracket) on the
+    merged sections and returns the final JSON output.
+    """
     all_accounts_raw = final_sections.get("accounts", [])
     reportable_accounts_raw = [
         acc for acc in all_accounts_raw 
@@ -84,14 +128,76 @@ def process_credit_report(pdf_file_path):
     
     return final_json_output
 
+def process_credit_report(pdf_file_path, store=None, source_name=None):
+    """
+    Main processing logic for a single credit report PDF.
+    Takes a file path, processes it, and returns a JSON object with the full analysis.
+    If a ReportStore is given, extraction and chunk results are persisted to it.
+    """
+    chunk_results = extract_chunk_sections(pdf_file_path, store=store, source_name=source_name)
+    final_sections = merge_chunk_sections(chunk_results)
+    return analyze_sections(final_sections)
+
+def reanalyze_stored_reports(store):
+    """
+    Re-runs only the downstream stages over every report in the store, reusing
+    the stored chunk results. Use after changing the underwriting rules or ratings.
+    Returns a dictionary mapping each report hash to its fresh analysis.
+    Reports with incomplete text, no stored chunks or failed chunks are not
+    re-analyzed and are returned flagged as incomplete instead.
+    """
+    results = {}
+    reports = store.list_reports()
+    for i, report in enumerate(reports):
+        print(f"\n--- Re-analyzing report {i+1}/{len(reports)}: {report['source_name']} ---")
+        chunk_results = store.load_chunks(report["report_hash"])
+        failed_chunks = [index for index, sections in enumerate(chunk_results) if sections is None]
+        if not report["text_complete"] or not chunk_results or failed_chunks:
+            if not report["text_complete"]:
+                reason = "text extraction incomplete (empty or scanned pages not OCR'd)"
+            elif not chunk_results:
+                reason = "no stored chunks"
+            else:
+                reason = f"{len(failed_chunks)} of {len(chunk_results)} chunks failed segmentation"
+            print(f"Warning: skipping incomplete report {report['source_name']}: {reason}. Re-process the PDF to complete it.")
+            results[report["report_hash"]] = {
+                "source_name": report["source_name"],
+                "incomplete": True,
+                "incomplete_reason": reason,
+            }
+            continue
+
+        final_sections = merge_chunk_sections(chunk_results)
+        analysis_json = analyze_sections(final_sections)
+        analysis_json["source_name"] = report["source_name"]
+        results[report["report_hash"]] = analysis_json
+    return results
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Process a credit report PDF and generate a JSON analysis.")
-    parser.add_argument("pdf_file", help="The path to the PDF credit report file.")
+    parser.add_argument("pdf_file", nargs="?", help="The path to the PDF credit report file.")
+    parser.add_argument("--store", metavar="DB_PATH", default=None,
+                        help=f"Persist extracted text and chunk results to this SQLite store (--reanalyze defaults to {DEFAULT_STORE_PATH}).")
+    parser.add_argument("--reanalyze", action="store_true",
+                        help="Re-run only the downstream analysis over every report in the store.")
     args = parser.parse_args()
 
-    # Process the report and get the JSON output
-    analysis_json = process_credit_report(args.pdf_file)
+    if args.reanalyze:
+        store_path = args.store or DEFAULT_STORE_PATH
+        if not os.path.exists(store_path):
+            parser.error(f"report store not found: {store_path}")
+        with ReportStore(store_path) as store:
+            analysis_json = reanalyze_stored_reports(store)
+    elif args.pdf_file:
+        # Process the report and get the JSON output
+        if args.store:
+            with ReportStore(args.store) as store:
+                analysis_json = process_credit_report(args.pdf_file, store=store)
+        else:
+            analysis_json = process_credit_report(args.pdf_file)
+    else:
+        parser.error("a PDF file is required unless --reanalyze is given")
     
     # Pretty-print the JSON to the console
     print("\n--- Analysis Complete ---")
-    print(json.dumps(analysis_json, indent=4))
\ No newline at end of file
+    print(json.dumps(analysis_json, indent=4))
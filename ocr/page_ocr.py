@@ -0,0 +1,158 @@
+import hashlib
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import pytesseract
+    from PIL import Image
+except ImportError:  # OCR is optional; scanned pages are skipped without it
+    pytesseract = None
+    Image = None
+
+# OCR text of credit reports is sensitive, so the on-disk cache is opt-in
+DEFAULT_CACHE_DIR = os.getenv("OCR_CACHE_DIR") or None
+DEFAULT_MAX_WORKERS = int(os.getenv("OCR_MAX_WORKERS", "0")) or os.cpu_count() or 1
+DEFAULT_MAX_TEXT_CHARS = 200
+DEFAULT_MIN_IMAGE_COVERAGE = 0.5
+
+def _image_coverage(page) -> float:
+    """Return the fraction of the page area covered by images, capped at 1."""
+    page_rect = page.rect
+    if page_rect.is_empty:
+        return 0.0
+    image_area = 0.0
+    for info in page.get_image_info():
+        bbox = page_rect & info["bbox"]
+        if not bbox.is_empty:
+            image_area += bbox.width * bbox.height
+    return min(image_area / (page_rect.width * page_rect.height), 1.0)
+
+def find_image_only_pages(
+    doc,
+    page_texts: List[str],
+    max_text_chars: int = DEFAULT_MAX_TEXT_CHARS,
+    min_image_coverage: float = DEFAULT_MIN_IMAGE_COVERAGE
+) -> List[int]:
+    """
+    Return the indices of pages of a PyMuPDF document that need OCR: pages mostly
+    covered by images whose text layer is short (e.g. only a scanner stamp or footer).
+    page_texts holds the already extracted text of each page.
+    """
+    image_pages = []
+    for index, page in enumerate(doc):
+        if len(page_texts[index].strip()) > max_text_chars:
+            continue
+        if _image_coverage(page) >= min_image_coverage:
+            image_pages.append(index)
+    return image_pages
+
+def page_digest(doc, page) -> str:
+    """
+    Return a cheap digest of a page's source: its content stream plus the raw
+    streams of the images it draws. Used as the OCR cache key without rendering.
+    """
+    digest = hashlib.sha256(page.read_contents())
+    for image in page.get_images(full=True):
+        digest.update(doc.xref_stream_raw(image[0]) or b"")
+    return digest.hexdigest()
+
+class PageOCR:
+    """
+    OCRs selected pages of a PDF with a local Tesseract install.
+    Pages are rendered with PyMuPDF and OCR'd in a thread pool (pytesseract runs
+    each page in its own tesseract process). When a cache directory is configured,
+    the text is cached on disk by page digest, resolution and OCR language.
+    """
+    def __init__(
+        self,
+        cache_dir=DEFAULT_CACHE_DIR,
+        dpi: int = 300,
+        lang: str = "eng",
+        max_workers: int = DEFAULT_MAX_WORKERS
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.dpi = dpi
+        self.lang = lang
+        self.max_workers = max_workers
+        # MuPDF is not thread-safe, so workers take turns rendering and only OCR in parallel
+        self._render_lock = threading.Lock()
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check that pytesseract is installed and the tesseract binary can be found."""
+        if pytesseract is None:
+            return False
+        try:
+            pytesseract.get_tesseract_version()
+            return True
+        except Exception:
+            return False
+
+    def _cache_path(self, page_hash: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{page_hash}-{self.dpi}-{self.lang}.txt"
+
+    def _write_cache(self, page_hash: str, text: str):
+        """Write a cache entry atomically so concurrent runs never read a partial file."""
+        if self.cache_dir is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                tmp_file.write(text)
+            os.replace(tmp_path, self._cache_path(page_hash))
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    def _ocr_page(self, doc, index: int) -> str:
+        """Render one page and run Tesseract on it. Executed inside worker threads."""
+        with self._render_lock:
+            pixmap = doc[index].get_pixmap(dpi=self.dpi, alpha=False)
+            image = Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+            del pixmap
+        return pytesseract.image_to_string(image, lang=self.lang)
+
+    def ocr_pages(self, doc, page_indices: List[int]) -> Dict[int, str]:
+        """
+        OCR the given pages of an open PyMuPDF document.
+        Returns a dictionary mapping page index to its OCR text.
+        """
+        if not page_indices:
+            return {}
+        if not self.is_available():
+            print("OCR unavailable: install pytesseract and Tesseract to read scanned pages.")
+            return {}
+
+        results = {}
+        pending = {}
+        for index in page_indices:
+            page_hash = page_digest(doc, doc[index]) if self.cache_dir is not None else None
+            cache_path = self._cache_path(page_hash) if page_hash else None
+            if cache_path is not None and cache_path.exists():
+                results[index] = cache_path.read_text(encoding="utf-8")
+            else:
+                pending[index] = page_hash
+
+        if pending:
+            print(f"OCR'ing {len(pending)} page(s), {len(results)} served from cache.")
+            # Tesseract uses every core via OpenMP by default; with one page per
+            # worker that oversubscribes the CPU, so pin each process to one thread
+            os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+            indices = list(pending)
+            workers = max(1, min(self.max_workers, len(indices)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                texts = list(pool.map(lambda index: self._ocr_page(doc, index), indices))
+
+            for index, text in zip(indices, texts):
+                if pending[index]:
+                    self._write_cache(pending[index], text)
+                results[index] = text
+
+        return results
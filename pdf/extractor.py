@@ -2,13 +2,27 @@ import fitz  # PyMuPDF
 import pdfplumber
 import PyPDF2
 from pathlib import Path
+from ocr.page_ocr import PageOCR, find_image_only_pages, DEFAULT_MAX_TEXT_CHARS, DEFAULT_MIN_IMAGE_COVERAGE
 
 class PDFTextExtractor:
     """
     Extracts text from a PDF using multiple fallback strategies.
+    Image-only (scanned) pages are OCR'd when an OCR engine is available.
     """
-    def __init__(self, pdf_path):
+    def __init__(
+        self,
+        pdf_path,
+        use_ocr=True,
+        ocr_max_text_chars=DEFAULT_MAX_TEXT_CHARS,
+        ocr_min_image_coverage=DEFAULT_MIN_IMAGE_COVERAGE
+    ):
         self.pdf_path = Path(pdf_path)
+        self.ocr = PageOCR() if use_ocr else None
+        self.ocr_max_text_chars = ocr_max_text_chars
+        self.ocr_min_image_coverage = ocr_min_image_coverage
+        self.is_scanned = False
+        # True when image-only pages were found but not all of them could be OCR'd
+        self.ocr_incomplete = False
 
     def extract_text(self):
         """
@@ -23,6 +37,11 @@ class PDFTextExtractor:
         except Exception as e:
             print(f"PyMuPDF failed: {e}")
 
+        # The other engines only read the text layer, which a scan does not have
+        if self.is_scanned:
+            print("Document is scanned and OCR produced no usable text.")
+            return ""
+
         # Fallback 1: pdfplumber
         try:
             text = self.extract_with_pdfplumber()
@@ -45,12 +64,26 @@ class PDFTextExtractor:
         return ""
 
     def extract_with_pymupdf(self):
-        """Extract text using PyMuPDF."""
-        text = ""
+        """Extract text using PyMuPDF, OCR'ing any image-only pages."""
         with fitz.open(self.pdf_path) as doc:
-            for page in doc:
-                text += page.get_text()
-        return text
+            pages = [page.get_text() for page in doc]
+            image_pages = find_image_only_pages(
+                doc,
+                pages,
+                max_text_chars=self.ocr_max_text_chars,
+                min_image_coverage=self.ocr_min_image_coverage
+            )
+            self.is_scanned = bool(pages) and len(image_pages) == len(pages)
+            ocr_text = {}
+            if image_pages and self.ocr is not None:
+                try:
+                    ocr_text = self.ocr.ocr_pages(doc, image_pages)
+                except Exception as e:
+                    print(f"OCR failed: {e}")
+            for index, page_text in ocr_text.items():
+                pages[index] = page_text
+            self.ocr_incomplete = len(ocr_text) < len(image_pages)
+        return "".join(pages)
 
     def extract_with_pdfplumber(self):
         """Extract text using pdfplumber."""
@@ -1,11 +1,14 @@
 import os
 import requests
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, HttpUrl
 import tempfile
+from urllib.parse import urlparse
 
 # Import the core processing logic from main.py
 from main import process_credit_report
+from storage.report_store import ReportStore
 
 app = FastAPI(
     title="Credit Report Processing Service",
@@ -34,6 +37,18 @@ def download_file(url: str, prefix: str = 'downloaded-', suffix: str = '.pdf') -
         print(f"Error downloading file: {e}")
         raise HTTPException(status_code=400, detail=f"Failed to download or access the file from the provided URL: {e}")
 
+def process_and_store(pdf_path: str, source_name: str):
+    """
+    Runs the pipeline on a downloaded PDF. When REPORT_STORE_PATH is set, the
+    extracted text and chunk results are persisted for later re-analysis.
+    Opens its own store connection, since it runs in a worker thread.
+    """
+    store_path = os.getenv("REPORT_STORE_PATH")
+    if not store_path:
+        return process_credit_report(pdf_path)
+    with ReportStore(store_path) as store:
+        return process_credit_report(pdf_path, store=store, source_name=source_name)
+
 @app.post("/process-report/", tags=["Credit Report Processing"])
 async def process_report_from_url(request: ReportRequest):
     """
@@ -48,7 +63,9 @@ async def process_report_from_url(request: ReportRequest):
         
         # 2. Run the main processing logic on the downloaded file
         print(f"Processing temporary file: {tmp_path}")
-        analysis_json = process_credit_report(tmp_path)
+        # Run the blocking pipeline (PDF extraction, OCR, LLM calls) off the event loop
+        source_name = os.path.basename(urlparse(str(request.file_url)).path) or None
+        analysis_json = await run_in_threadpool(process_and_store, tmp_path, source_name)
         
         if not analysis_json:
             raise HTTPException(status_code=500, detail="The analysis process returned no data.")
@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_STORE_PATH = os.getenv("REPORT_STORE_PATH", "report_store.db")
+
+def hash_file(path) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(65536), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def hash_text(text: str) -> str:
+    """Return the SHA-256 hex digest of a text string."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+class ReportStore:
+    """
+    Persists extracted report text and per-chunk segmentation results in SQLite,
+    so downstream underwriting can be re-run without re-extracting or re-segmenting.
+    """
+    def __init__(self, db_path=DEFAULT_STORE_PATH):
+        self.db_path = Path(db_path)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self._create_tables()
+
+    def _create_tables(self):
+        """Create the store schema if it does not already exist."""
+        with self.conn:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS reports (
+                    report_hash TEXT PRIMARY KEY,
+                    source_name TEXT,
+                    text TEXT NOT NULL,
+                    text_complete INTEGER NOT NULL DEFAULT 1,
+                    created_at TEXT NOT NULL
+                )
+                """
+            )
+            columns = [row[1] for row in self.conn.execute("PRAGMA table_info(reports)")]
+            if "text_complete" not in columns:
+                self.conn.execute("ALTER TABLE reports ADD COLUMN text_complete INTEGER NOT NULL DEFAULT 1")
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS chunks (
+                    report_hash TEXT NOT NULL REFERENCES reports(report_hash) ON DELETE CASCADE,
+                    chunk_index INTEGER NOT NULL,
+                    chunk_hash TEXT NOT NULL,
+                    sections TEXT,
+                    PRIMARY KEY (report_hash, chunk_index)
+                )
+                """
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_chunks_hash ON chunks(chunk_hash)")
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def get_text(self, report_hash: str) -> Optional[str]:
+        """
+        Return the stored extracted text for a report, or None if it is not stored
+        or was stored incomplete (e.g. empty, or with scanned pages OCR skipped).
+        """
+        row = self.conn.execute(
+            "SELECT text FROM reports WHERE report_hash = ? AND text_complete = 1", (report_hash,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def save_text(self, report_hash: str, text: str, complete: bool = True, source_name: Optional[str] = None):
+        """Store the extracted text for a report, replacing any previous chunks."""
+        with self.conn:
+            self.conn.execute("DELETE FROM chunks WHERE report_hash = ?", (report_hash,))
+            self.conn.execute(
+                "INSERT OR REPLACE INTO reports (report_hash, source_name, text, text_complete, created_at) VALUES (?, ?, ?, ?, ?)",
+                (report_hash, source_name, text, int(complete), datetime.now().isoformat())
+            )
+
+    def get_chunk_sections(self, chunk_hash: str) -> Optional[Dict]:
+        """
+        Return a previously segmented result for a chunk with identical text, if any.
+        Chunks whose segmentation failed are stored as NULL and are not returned.
+        """
+        row = self.conn.execute(
+            "SELECT sections FROM chunks WHERE chunk_hash = ? AND sections IS NOT NULL LIMIT 1",
+            (chunk_hash,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_chunk(self, report_hash: str, chunk_index: int, chunk_text: str, sections: Optional[Dict]):
+        """Store the segmentation result for one chunk of a report as soon as it is available."""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO chunks (report_hash, chunk_index, chunk_hash, sections) VALUES (?, ?, ?, ?)",
+                (
+                    report_hash,
+                    chunk_index,
+                    hash_text(chunk_text),
+                    json.dumps(sections) if isinstance(sections, dict) else None,
+                )
+            )
+
+    def prune_chunks(self, report_hash: str, chunk_count: int):
+        """Delete stored chunks of a report beyond its current chunk count."""
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM chunks WHERE report_hash = ? AND chunk_index >= ?",
+                (report_hash, chunk_count)
+            )
+
+    def load_chunks(self, report_hash: str) -> List[Optional[Dict]]:
+        """Return the stored per-chunk results for a report, in chunk order."""
+        rows = self.conn.execute(
+            "SELECT sections FROM chunks WHERE report_hash = ? ORDER BY chunk_index",
+            (report_hash,)
+        ).fetchall()
+        return [json.loads(row[0]) if row[0] else None for row in rows]
+
+    def list_reports(self) -> List[Dict]:
+        """Return the hash, source name and text completeness of every stored report."""
+        rows = self.conn.execute(
+            "SELECT report_hash, source_name, text_complete FROM reports ORDER BY created_at"
+        ).fetchall()
+        return [
+            {"report_hash": row[0], "source_name": row[1], "text_complete": bool(row[2])}
+            for row in rows
+        ]